@@ -0,0 +1,100 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the ``text_to_num`` library.
+"""
+from unittest import TestCase
+from datetime import date, timedelta
+
+from text_to_num.lang.postprocess import CurrencyFormatter, DecimalMerger, PostProcessorES
+
+
+class TestDecimalMerger(TestCase):
+    def test_merge_decimals(self):
+        merger = DecimalMerger()
+        self.assertEqual(
+            merger.merge_decimals("3.1 2 3 4 5 6 7 8 9".split()), ["3.123456789"]
+        )
+        self.assertEqual(
+            merger.merge_decimals("hello 3.1 2.5 okay".split()),
+            ["hello", "3.1", "2.5", "okay"],
+        )
+        self.assertEqual(
+            merger.merge_decimals("hi 3. 7 42 yes".split()),
+            ["hi", "3.", "7", "42", "yes"],
+        )
+        self.assertEqual(
+            merger.merge_decimals("123456.722 1 15".split()),
+            ["123456.722", "1", "15"],
+        )
+
+    def test_max_decimal(self):
+        merger = DecimalMerger(",", max_decimal=4)
+        self.assertEqual(
+            merger.merge_decimals("3,12 44 55 66".split()), ["3,1244", "55", "66"]
+        )
+
+
+class TestCurrencyFormatter(TestCase):
+    def test_format_currency(self):
+        formatter = CurrencyFormatter()
+        self.assertEqual(
+            formatter.format_currency("tengo 3 euros con 50 céntimos"), "tengo €3.50"
+        )
+        self.assertEqual(formatter.format_currency("un dólar"), "$1.00")
+        self.assertEqual(formatter.format_currency("5 dolares y 7 centavos"), "$5.07")
+        self.assertEqual(formatter.format_currency("3 euros con un céntimo"), "€3.01")
+        self.assertEqual(formatter.format_currency("2 dólares y una"), "$2.01")
+        self.assertEqual(formatter.format_currency("12 Euros"), "€12.00")
+        self.assertEqual(formatter.format_currency("nada"), "nada")
+
+
+class TestPostProcessorES(TestCase):
+    def test_format_date(self):
+        pp = PostProcessorES()
+        source = "Hoy es el 13 de octubre del 1999."
+        self.assertEqual(pp.format_date(source), "Hoy es el 13/10/1999.")
+        self.assertEqual(
+            pp.format_date(source, month_name=True), "Hoy es el 13 octubre 1999."
+        )
+        self.assertEqual(pp.format_date("el 7 032021"), "el 7/03/2021")
+
+    def test_format_date_range(self):
+        pp = PostProcessorES()
+        connectors = ["del", "de"]
+        # every day of a leap year, then every supported year
+        days = [date(2000, 1, 1) + timedelta(days=n) for n in range(366)]
+        days += [date(year, 12, 31) for year in range(1900, 2100)]
+        for day in days:
+            month = pp.MONTHS[day.month - 1]
+            source = f"Hoy es el {day.day} de {month} {connectors[day.day % 2]} {day.year}."
+            self.assertEqual(
+                pp.format_date(source), f"Hoy es el {day.day}/{day.month}/{day.year}."
+            )
+
+    def test_format_time(self):
+        pp = PostProcessorES()
+        self.assertEqual(pp.format_time("Hey son las 5 y 7."), "Hey son las 5:07.")
+        self.assertEqual(pp.format_time("Hey es la 1 y 30."), "Hey es la 1:30.")
+        self.assertEqual(pp.format_time("Son las 8."), "Son las 8:00.")
@@ -0,0 +1,75 @@
+# MIT License
+
+# Copyright (c) 2018-2019 Groupe Allo-Media
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Test the ``text_to_num`` library.
+"""
+from unittest import TestCase
+from text_to_num import alpha2digit
+from text_to_num.lang import Dutch
+
+
+class TestTextToNumNL(TestCase):
+    def test_split_number_word(self):
+        dutch = Dutch()
+        self.assertEqual(
+            dutch.split_number_word("zevenhonderdtweeëndertigduizendvijfhonderdtweeënzeventig"),
+            "zeven honderd tweeëndertig duizend vijf honderd tweeënzeventig",
+        )
+        self.assertEqual(dutch.split_number_word("honderdéén"), "honderd één")
+        self.assertEqual(dutch.split_number_word("eenendertigéén"), "eenendertig één")
+        self.assertEqual(dutch.split_number_word("tweehonderdste"), "twee honderdste")
+        self.assertEqual(dutch.split_number_word("driehonderdvierde"), "drie honderd vierde")
+        self.assertEqual(dutch.split_number_word("hemdenwinkel"), "hemdenwinkel")
+        self.assertEqual(dutch.split_number_word("ideeënbus"), "ideeënbus")
+        self.assertEqual(dutch.split_number_word("zeeënkaart"), "zeeënkaart")
+        self.assertEqual(dutch.split_number_word_0("zeeën"), "zeeën")
+        self.assertEqual(dutch.split_number_word("1234567890"), "1234567890")
+
+    def test_ord2card(self):
+        dutch = Dutch()
+        ordinals = "nulde eerste tweede derde vierde vijfde zesde zevende achtste negende".split()
+        cardinals = "nul één twee drie vier vijf zes zeven acht negen".split()
+        self.assertEqual([dutch.ord2card(word) for word in ordinals], cardinals)
+        self.assertEqual(dutch.ord2card("twintigste"), "twintig")
+        self.assertEqual(dutch.ord2card("tweeëntwintigste"), "tweeëntwintig")
+        self.assertIsNone(dutch.ord2card("twintig"))
+
+    def test_alpha2digit_integers(self):
+        source = "ik heb zevenhonderdtweeëndertigduizendvijfhonderdtweeënzeventig euro"
+        expected = "ik heb 732572 euro"
+        self.assertEqual(alpha2digit(source, "nl"), expected)
+        self.assertEqual(alpha2digit("honderdéén dalmatiërs", "nl"), "101 dalmatiërs")
+        self.assertEqual(alpha2digit("min drieënveertig graden", "nl"), "-43 graden")
+        self.assertEqual(alpha2digit("tweeënhalf", "nl"), "2 ënhalf")
+
+    def test_alpha2digit_non_numbers(self):
+        for text in ["ideeënbus", "zeeënkaart", "knieënbeschermer", "Eén"]:
+            self.assertEqual(alpha2digit(text, "nl"), text)
+        self.assertEqual(alpha2digit("twee ideeënbussen", "nl"), "2 ideeënbussen")
+
+    def test_alpha2digit_ordinals(self):
+        self.assertEqual(alpha2digit("de eenentwintigste eeuw", "nl"), "de 21e. eeuw")
+        self.assertEqual(alpha2digit("duizendeerste nacht", "nl"), "1001e. nacht")
+        self.assertEqual(alpha2digit("de tweeëntwintigste keer", "nl"), "de 22e. keer")
+        self.assertEqual(alpha2digit("hij is de tweede", "nl"), "hij is de tweede")
@@ -24,29 +24,31 @@
 Base type for language objects.
 """
 
-from typing import Dict, Optional, Set, Tuple
+from typing import AbstractSet, Dict, Mapping, Optional, Tuple
 
 
 class Language:
     """Base class for language object."""
 
-    MULTIPLIERS: Dict[str, int]
-    UNITS: Dict[str, int]
-    STENS: Dict[str, int]
-    MTENS: Dict[str, int]
-    MTENS_WSTENS: Set[str]
-    HUNDRED: Dict[str, int]
-    MHUNDREDS: Dict[str, int] = {}
-    NUMBERS: Dict[str, int]
+    __slots__ = ()
+
+    MULTIPLIERS: Mapping[str, int]
+    UNITS: Mapping[str, int]
+    STENS: Mapping[str, int]
+    MTENS: Mapping[str, int]
+    MTENS_WSTENS: AbstractSet[str]
+    HUNDRED: Mapping[str, int]
+    MHUNDREDS: Mapping[str, int] = {}
+    NUMBERS: Mapping[str, int]
 
     SIGN: Dict[str, str]
-    ZERO: Set[str]
+    ZERO: AbstractSet[str]
     DECIMAL_SEP: str
     DECIMAL_SYM: str
 
-    AND_NUMS: Set[str]
+    AND_NUMS: AbstractSet[str]
     AND: str
-    NEVER_IF_ALONE: Set[str]
+    NEVER_IF_ALONE: AbstractSet[str]
 
     # Relaxed composed numbers (two-words only)
     # start => (next, target)
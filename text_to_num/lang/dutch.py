@@ -20,7 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Dict, Tuple, Set, Optional
+from types import MappingProxyType
+from typing import AbstractSet, Any, Dict, Iterable, List, Tuple, Set, Optional
 import re
 
 from .base import Language
@@ -73,6 +74,8 @@ MTENS: Dict[str, int] = {
 
 # Single tens that are from 20 to 99. In Dutch, consider these as atomic units
 #    so that we don't have to deal with the reversed order of tens & units.
+# "ë" is only accepted in the "ën" connector after a unit ending in "e" (tweeëntwintig),
+#    elsewhere it is a regular letter (ideeën, zeeën).
 STENS_99 = dict()
 for w10, v10 in MTENS.items():
     for w1, v1 in UNITS.items():
@@ -99,38 +102,74 @@ NUMBERS.update(HUNDRED)
 # NUMBERS.update(COMPOSITES) # COMPOSITES are already in STENS for the German language
 
 AND = "en"
-ZERO = {"nul","null"}
+ZERO = frozenset({"nul", "null"})
+
+
+def build_trie(words: Iterable[str]) -> Dict[str, Any]:
+    """Build a character trie of ``words``.
+
+    Each node maps a character to its child node; the empty string key marks
+    the end of a word and holds that word.
+    """
+    trie: Dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = word
+    return trie
+
+
+def group_by_first_char(words: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """Group ``words`` by their first character, keeping their order."""
+    groups: Dict[str, List[str]] = {}
+    for word in words:
+        groups.setdefault(word[0], []).append(word)
+    return {char: tuple(group) for char, group in groups.items()}
 
 
 
 class Dutch(Language):
+    # instances are stateless, everything below is shared and read-only
+    __slots__ = ()
+
     NUMBERS_SET = set(NUMBERS.keys())
     NUMBERS_SET.update(ZERO)
     
     # Irregular ordinals
     ORDINALS_IR = {"eerste":"één", "derde":"drie"}
     # Ordinals that are made by appending -de
-    ORDINALS_DE = set("tien elf twaalf dertien veertien vijftien zestien zeventien achttien negentien".split())
-    ORDINALS_DE.update(set("nul null twee vier vijf zes zeven negen".split()))
+    ORDINALS_DE = {*ZERO, *STENS_19, "twee", "vier", "vijf", "zes", "zeven", "negen"}
     # Ordinals that are made by appending -ste
     ORDINALS_STE = set([*MULTIPLIERS, *MTENS, *STENS_99, *HUNDRED, "acht"])
-
-    MULTIPLIERS = MULTIPLIERS
-    UNITS = UNITS
-    STENS = STENS
-    MTENS = MTENS
-    MTENS_WSTENS = MTENS_WSTENS
-    HUNDRED = HUNDRED
-    NUMBERS = NUMBERS
+    # All ordinals with their cardinal
+    ORDINALS: Dict[str, str] = {
+        **{w + "de": w for w in ORDINALS_DE},
+        **{w + "ste": w for w in ORDINALS_STE},
+        **ORDINALS_IR,
+    }
+
+    MULTIPLIERS = MappingProxyType(MULTIPLIERS)
+    UNITS = MappingProxyType(UNITS)
+    STENS = MappingProxyType(STENS)
+    MTENS = MappingProxyType(MTENS)
+    MTENS_WSTENS = frozenset(MTENS_WSTENS)
+    HUNDRED = MappingProxyType(HUNDRED)
+    NUMBERS = MappingProxyType(NUMBERS)
 
     # Sort all numbers by length and start with the longest. For splitting merged words.
-    ALL_WORDS_SORTED_REVERSE = sorted(
+    ALL_WORDS_SORTED_REVERSE: Tuple[str, ...] = tuple(sorted(
         # add "und" and "null" to NUMBERS
         ["en", *ZERO, *NUMBERS, *ORDINALS_IR],
         # take reverse length of keys to sort
         key=lambda x: len(x),
         reverse=True
-    )
+    ))
+    # Same words grouped by first letter, so that only plausible candidates are checked.
+    WORDS_BY_FIRST_CHAR = group_by_first_char(ALL_WORDS_SORTED_REVERSE)
+    # Same words as a trie, for longest-match splitting in one pass.
+    # Regular -ste ordinals are included so that they are matched in the same walk.
+    TRIE = build_trie([*ALL_WORDS_SORTED_REVERSE, *(w + "ste" for w in ORDINALS_STE)])
 
     SIGN = {"plus": "+", "min": "-", "minus": "-"}
     ZERO = ZERO
@@ -138,11 +177,11 @@ class Dutch(Language):
     DECIMAL_SYM = ","
 
     # AND_NUMS = set(UNITS.keys()).union(set(STENS.keys()).union(set(MTENS.keys())))
-    AND_NUMS: Set[str] = set()
+    AND_NUMS: AbstractSet[str] = frozenset()
     AND = AND
 
-    NEVER_IF_ALONE = {"één"}
-    NEVER_CONNECTS_WITH_AND = {"één"}
+    NEVER_IF_ALONE = frozenset({"één"})
+    NEVER_CONNECTS_WITH_AND = frozenset({"één"})
 
     # Relaxed composed numbers (two-words only)
     # start => (next, target)
@@ -152,14 +191,7 @@ class Dutch(Language):
         """Convert ordinal number to cardinal.
         Return None if word is not an ordinal or is better left in letters.
         """
-        if len(word) > 4:
-            if word in self.ORDINALS_IR:
-                return self.ORDINALS_IR[word]
-            if word.endswith("ste") and word[:-3].lower() in self.ORDINALS_STE:
-                return word[:-3]
-            if word.endswith("de") and word[:-2].lower() in self.ORDINALS_DE:
-                return word[:-2]
-        return None
+        return self.ORDINALS.get(word)
 
     def num_ord(self, digits: str, original_word: str) -> str:
         """Add suffix to number in digits to make an ordinal"""
@@ -175,49 +207,53 @@ class Dutch(Language):
         if len(word) < 9: # shortest compound word is 10 chars e.g. honderd+één
             return word
         text = word.lower()  # NOTE: if we want to use this outside it should keep case
-        invalid_word = ""
+        # no number word can start anywhere (e.g. digits only): nothing to split
+        if self.TRIE.keys().isdisjoint(text):
+            return word
+        length = len(text)
         result = []
-        isnum = []
-        while len(text) > 0:
-            # start with the longest
-            found = False
-            for sw in self.ALL_WORDS_SORTED_REVERSE:
-                # Check at the beginning of the current sentence for the longest word in ALL_WORDS
-                if text.startswith(sw):
-                    if len(invalid_word) > 0:
-                        result.append(invalid_word)
-                        invalid_word = ""
-                    # If this is a regular ordinal, expand word accordingly
-                    if text[len(sw):].startswith("ste") and sw in self.ORDINALS_STE:
-                        sw += "ste"
-                    result.append(sw)
-                    isnum.append(-1 if sw=="en" else 1)
-                    text = text[len(sw):]
-                    found = True
+        has_number = False  # "en" alone doesn't count
+        # text[start:i] is the pending part that could not be assigned to a word
+        start = i = 0
+        while i < length:
+            # walk down the trie as far as text allows, remembering the longest word seen
+            node = self.TRIE
+            sw = None
+            j = end = i
+            while j < length:
+                child = node.get(text[j])
+                if child is None:
                     break
-            # current beginning could not be assigned to a word:
-            if not found:
-                if not text[0] == " ":
-                    # move one index
-                    invalid_word += text[0:1]
-                    text = text[1:]
-                else:
-                    if len(invalid_word) > 0:
-                        result.append(invalid_word)
-                        isnum.append(0)
-                        invalid_word = ""
-                    text = text[1:]
-        if len(invalid_word) > 0:
+                node = child
+                j += 1
+                if "" in node:
+                    sw = node[""]
+                    end = j
+            if sw is not None:
+                if start < i:
+                    result.append(text[start:i])
+                result.append(sw)
+                if sw != "en":
+                    has_number = True
+                i = start = end
+            elif text[i] == " ":
+                if start < i:
+                    result.append(text[start:i])
+                i += 1
+                start = i
+            else:
+                # move one index
+                i += 1
+        if start < length:
+            invalid_word = text[start:]
             # for now, assume regular-"de"-ordinal (e.g. negende) can occur only at the end
             if invalid_word == "de" and result and result[-1] in self.ORDINALS_DE:
                 result[-1] += "de"
             else:
                 result.append(invalid_word)
-                isnum.append(0)
-        # apply some checks to make sure we are not splitting a non-number word
-        if all(x != 1 for x in isnum): # if all non-number or "en", don't split
+        # make sure we are not splitting a non-number word
+        if not has_number:
             return word
-        # if all(x != 0 for x in isnum):
         return " ".join(result)
 
     def split_number_word_0(self, word: str) -> str:
@@ -225,35 +261,37 @@ class Dutch(Language):
         "zevenhonderdtweeëndertigduizendvijfhonderdtweeënzeventig" -> 'zeven honderd tweeëndertig duizend vijf honderd tweeënzeventig '
         """
         text = word.lower()  # NOTE: if we want to use this outside it should keep case
+        length = len(text)
         invalid_word = ""
         result = []
-        while len(text) > 0:
+        i = 0
+        while i < length:
             # start with the longest
             found = False
-            for sw in self.ALL_WORDS_SORTED_REVERSE:
-                # Check at the beginning of the current sentence for the longest word in ALL_WORDS
-                if text.startswith(sw):
+            for sw in self.WORDS_BY_FIRST_CHAR.get(text[i], ()):
+                # Check at the current position for the longest word in ALL_WORDS
+                if text.startswith(sw, i):
                     if len(invalid_word) > 0:
                         result.append(invalid_word)
                         invalid_word = ""
+                    i += len(sw)
                     # If this is a regular ordinal, expand word accordingly
-                    if text[len(sw):].startswith("ste") and sw in self.ORDINALS_STE:
+                    if text.startswith("ste", i) and sw in self.ORDINALS_STE:
                         sw += "ste"
+                        i += 3
                     result.append(sw)
-                    text = text[len(sw):]
                     found = True
                     break
             # current beginning could not be assigned to a word:
             if not found:
-                if not text[0] == " ":
+                if not text[i] == " ":
                     # move one index
-                    invalid_word += text[0:1]
-                    text = text[1:]
+                    invalid_word += text[i]
                 else:
                     if len(invalid_word) > 0:
                         result.append(invalid_word)
                         invalid_word = ""
-                    text = text[1:]
+                i += 1
         if len(invalid_word) > 0:
             # for now, assume regular-"de"-ordinal (e.g. negende) can occur only at the end
             if invalid_word == "de" and result and result[-1] in self.ORDINALS_DE:
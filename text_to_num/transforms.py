@@ -41,7 +41,7 @@ USE_PT_ORDINALS_MERGER = True
 omg_es = OrdinalsMergerES()
 USE_ES_ORDINALS_MERGER = True
 USE_DECIMAL_MERGER = True  # Merge decimal part that are spoken digit by digit, or in 2 digit parts, upto a certain length
-USE_CURRENCY_FORMATTER = True
+USE_CURRENCY_FORMATTER = False  # Format Spanish amounts as €3.50, $1.00...
 
 def look_ahead(sequence: Sequence[Any]) -> Iterator[Tuple[Any, Any]]:
     """Look-ahead iterator.